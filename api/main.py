@@ -1,7 +1,10 @@
 # api/main.py
 
 from fastapi import FastAPI
-from api.routes import job_routes, queue_routes
+from api.routes import job_routes, queue_routes, workflow_routes
+from config.logging_config import configure_logging
+
+configure_logging()
 
 app = FastAPI(title="DisQueue: Distributed Job Queue System")
 
@@ -11,3 +14,4 @@ def health_check():
 
 app.include_router(job_routes.router, prefix="/jobs", tags=["Jobs"])
 app.include_router(queue_routes.router, prefix="/queues", tags=["Queues"])
+app.include_router(workflow_routes.router, prefix="/workflows", tags=["Workflows"])
@@ -1,6 +1,6 @@
 # api/models.py
 
-from typing import Dict, Literal, Optional
+from typing import Dict, List, Literal, Optional
 from pydantic import BaseModel, Field
 from config.settings import settings
 
@@ -14,3 +14,24 @@ class JobRequest(BaseModel):
 class JobResponse(BaseModel):
     job_id: str
     status: str
+
+# Workflow steps reuse the single-job request schema
+class ChainRequest(BaseModel):
+    steps: List[JobRequest] = Field(min_length=1, description="Jobs to run one after another")
+
+class GroupRequest(BaseModel):
+    jobs: List[JobRequest] = Field(min_length=1, description="Jobs to run in parallel")
+
+class ChordRequest(BaseModel):
+    jobs: List[JobRequest] = Field(min_length=1, description="Jobs to run in parallel")
+    callback: JobRequest = Field(description="Job to run once every job in the group has completed")
+
+class WorkflowResponse(BaseModel):
+    job_ids: List[str]
+    status: str
+
+class ChordResponse(BaseModel):
+    chord_id: str
+    job_ids: List[str]
+    callback_job_id: str
+    status: str
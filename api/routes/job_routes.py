@@ -1,13 +1,16 @@
 # api/routes/job_routes.py
 
-from fastapi import APIRouter, HTTPException
+from functools import lru_cache
+from typing import Dict
+from fastapi import APIRouter, Depends, HTTPException
 from uuid import uuid4
 from api.models import JobRequest, JobResponse
 
 from core.registry import get_registered_queues
+from core.queue_config import DisqueueQueue
 
-from infrastructure.redis_conn import redis_client
-from infrastructure.redis_job_store import RedisJobStore
+from infrastructure.factory import get_job_store
+from infrastructure.job_store import JobStore
 
 from core.status import (
     STATUS_CANCELLED,
@@ -19,14 +22,15 @@ from core.status import (
 
 router = APIRouter()
 
-job_store = RedisJobStore(redis_client)
-registered_queues = get_registered_queues(job_store)
 
-# Create a mapping of queue name to DisqueueQueue instance
-queue_map = {q.name: q for q in registered_queues}
+# Resolved on first request rather than at import, so importing the API never builds a store/connection
+@lru_cache(maxsize=None)
+def get_queue_map() -> Dict[str, DisqueueQueue]:
+    """Mapping of queue name to DisqueueQueue instance."""
+    return {q.name: q for q in get_registered_queues(get_job_store())}
 
 @router.post("/", response_model=JobResponse)
-def submit_job(job: JobRequest):
+def submit_job(job: JobRequest, queue_map: Dict[str, DisqueueQueue] = Depends(get_queue_map)):
     job_id = str(uuid4())
 
     queue_name = job.queue_name or "default"
@@ -53,7 +57,7 @@ def submit_job(job: JobRequest):
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-def get_status(job_id: str):
+def get_status(job_id: str, job_store: JobStore = Depends(get_job_store)):
     status = job_store.get_job_status(job_id)
     if not status:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -61,7 +65,7 @@ def get_status(job_id: str):
 
 
 @router.post("/{job_id}/cancel")
-def cancel_job_handler(job_id: str):
+def cancel_job_handler(job_id: str, job_store: JobStore = Depends(get_job_store)):
     current_status = job_store.get_job_status(job_id)
 
     if current_status is None:
@@ -0,0 +1,64 @@
+# api/routes/workflow_routes.py
+
+from functools import lru_cache
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from api.models import JobRequest, ChainRequest, GroupRequest, ChordRequest, WorkflowResponse, ChordResponse
+
+from api.routes.job_routes import get_queue_map
+from core.workflow import JobSignature, WorkflowEnqueueError, WorkflowManager
+
+from infrastructure.factory import get_job_store
+
+
+router = APIRouter()
+
+
+@lru_cache(maxsize=None)
+def get_workflow_manager() -> WorkflowManager:
+    """WorkflowManager over the same DisqueueQueue instances as the job routes."""
+    return WorkflowManager(get_queue_map().values(), get_job_store())
+
+
+def _to_signatures(jobs: List[JobRequest]) -> List[JobSignature]:
+    return [JobSignature(job.queue_name or "default", job.payload, job.priority) for job in jobs]
+
+
+@router.post("/chain", response_model=WorkflowResponse)
+def submit_chain(chain: ChainRequest, workflow_manager: WorkflowManager = Depends(get_workflow_manager)):
+    try:
+        job_ids = workflow_manager.enqueue_chain(_to_signatures(chain.steps))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except WorkflowEnqueueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return WorkflowResponse(job_ids=job_ids, status="queued")
+
+
+@router.post("/group", response_model=WorkflowResponse)
+def submit_group(group: GroupRequest, workflow_manager: WorkflowManager = Depends(get_workflow_manager)):
+    try:
+        job_ids = workflow_manager.enqueue_group(_to_signatures(group.jobs))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except WorkflowEnqueueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return WorkflowResponse(job_ids=job_ids, status="queued")
+
+
+@router.post("/chord", response_model=ChordResponse)
+def submit_chord(chord: ChordRequest, workflow_manager: WorkflowManager = Depends(get_workflow_manager)):
+    jobs = _to_signatures(chord.jobs)
+    callback = _to_signatures([chord.callback])[0]
+    try:
+        chord_id = workflow_manager.enqueue_chord(jobs, callback)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except WorkflowEnqueueError as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return ChordResponse(
+        chord_id=chord_id,
+        job_ids=[job.job_id for job in jobs],
+        callback_job_id=callback.job_id,
+        status="queued",
+    )
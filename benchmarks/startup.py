@@ -0,0 +1,101 @@
+# benchmarks/startup.py
+"""
+Measures worker and API cold start in fresh interpreters.
+
+    python benchmarks/startup.py [--runs 10] [--queue image_processing]
+
+Worker scenarios (in-memory backend, so no Redis server is needed) enqueue one job on
+--queue before starting the worker, then report (median over runs, milliseconds from
+before `import core.worker`):
+- import: importing the worker module
+- first_claim: the job is read from its stream (after_claim)
+- first_job: the job's handler returned and its offset was committed (after_ack)
+- handlers: handler modules imported by the time the first job finished
+
+"all queues" polls every registered queue, "filtered" runs with queue_names=[--queue].
+
+API scenarios import api.main with the default Redis backend (no server needed, the
+client is created lazily) and with the in-memory backend, and report whether
+`redis` got imported.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKER_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+import core.worker as worker
+timings = {{"import": (time.perf_counter() - t0) * 1000}}
+
+from core.hooks import Hook, register_hook
+from core.registry import get_registered_queues
+from infrastructure.factory import get_job_store
+
+class FirstJob(Hook):
+    def after_claim(self, queue_name, job_id):
+        timings.setdefault("first_claim", (time.perf_counter() - t0) * 1000)
+
+    def after_ack(self, queue_name, job_id, result):
+        timings["first_job"] = (time.perf_counter() - t0) * 1000
+        timings["result"] = result
+        timings["handlers"] = sorted(m for m in sys.modules if m.startswith("handlers."))
+        worker.shutdown_event.set()
+
+register_hook(FirstJob())
+job_store = get_job_store()
+job_store.block_seconds = 0
+queue = {{q.name: q for q in get_registered_queues(job_store)}}[{queue!r}]
+queue.enqueue("bench-job", {{"duration": 0}}, queue.config.priorities[0])
+worker.start_worker(queue_names={queue_names!r})
+print(json.dumps(timings))
+"""
+
+API_SNIPPET = """
+import json, sys, time
+t0 = time.perf_counter()
+import api.main
+print(json.dumps({"import": (time.perf_counter() - t0) * 1000, "redis_imported": "redis" in sys.modules}))
+"""
+
+
+def run_snippet(snippet: str, env: dict) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def bench(name: str, snippet: str, runs: int, env: dict):
+    samples = [run_snippet(snippet, env) for _ in range(runs)]
+    timings = [k for k, v in samples[0].items() if isinstance(v, float)]
+    summary = ", ".join(f"{k}={statistics.median(s[k] for s in samples):.1f}ms" for k in timings)
+    details = "".join(f"  {k}={v}" for k, v in samples[0].items() if not isinstance(v, float))
+    print(f"{name:<36} {summary}{details}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--queue", default="image_processing", help="Queue that receives the job and the worker filter")
+    args = parser.parse_args()
+
+    base_env = dict(os.environ, PYTHONPATH=REPO_ROOT, LOG_LEVEL="WARNING")
+    base_env.pop("JOB_STORE_BACKEND", None)
+    memory_env = dict(base_env, JOB_STORE_BACKEND="memory")
+
+    bench("worker (all queues)", WORKER_SNIPPET.format(queue=args.queue, queue_names=None), args.runs, memory_env)
+    bench(f"worker (filtered: {args.queue})", WORKER_SNIPPET.format(queue=args.queue, queue_names=[args.queue]), args.runs, memory_env)
+    bench("api (redis backend)", API_SNIPPET, args.runs, base_env)
+    bench("api (memory backend)", API_SNIPPET, args.runs, memory_env)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,118 @@
+# config/logging_config.py
+
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
+import queue
+import zlib
+
+from config.settings import settings
+
+_listener = None
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, including job context passed via `extra`."""
+
+    CONTEXT_FIELDS = ("job_id", "queue", "stream")
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in self.CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class JobSampleFilter(logging.Filter):
+    """
+    Keeps a fixed fraction of per-job lifecycle logs (records carrying a `job_id` extra).
+    Sampling is keyed on the job id, so a sampled job keeps all of its lines.
+    Warnings and errors are always kept.
+    """
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.threshold = int(rate * 10000)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        job_id = getattr(record, "job_id", None)
+        if job_id is None:
+            return True
+        return zlib.crc32(str(job_id).encode()) % 10000 < self.threshold
+
+
+class LazyQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that defers message formatting to the listener thread.
+    The stock prepare() formats in the calling thread, which is exactly the cost we want off the hot path.
+
+    Records whose args hold mutable containers (e.g. payloads with LOG_PAYLOADS=true) are still
+    formatted eagerly: the caller may mutate them before the listener gets to the record.
+    """
+
+    MUTABLE_ARG_TYPES = (dict, list, set, bytearray)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if args and (isinstance(args, dict) or any(isinstance(arg, self.MUTABLE_ARG_TYPES) for arg in args)):
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
 
 def configure_logging():
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s [%(levelname)s] %(message)s",
-    )
+    """
+    Configure the root logger from settings.
+
+    - log_mode="text" (default): synchronous plain-text logging to stderr.
+    - log_mode="async_json": records are handed to a queue and written as JSON by a listener thread.
+
+    log_sample_rate applies to both modes.
+    """
+    global _listener
+
+    level = getattr(logging, settings.log_level.upper(), logging.INFO)
+
+    if settings.log_mode != "async_json":
+        logging.basicConfig(
+            level=level,
+            format="%(asctime)s [%(levelname)s] %(message)s",
+        )
+        if settings.log_sample_rate < 1.0:
+            for handler in logging.getLogger().handlers:
+                if not any(isinstance(f, JobSampleFilter) for f in handler.filters):
+                    handler.addFilter(JobSampleFilter(settings.log_sample_rate))
+        return
+
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter())
+
+    queue_handler = LazyQueueHandler(queue.SimpleQueue())
+    if settings.log_sample_rate < 1.0:
+        # Filter before enqueueing so dropped records cost no queue traffic.
+        queue_handler.addFilter(JobSampleFilter(settings.log_sample_rate))
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
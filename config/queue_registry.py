@@ -4,11 +4,17 @@ from core.queue_config import QueueConfig
 
 # Users can modify this file to register any number of queues with custom config
 # This is business-logic agnostic and suitable for open-source usage
+# Handlers are given as import strings and imported only when a worker processes that queue
 
 REGISTERED_QUEUES = [
-    QueueConfig(name="default"), # implies all allowed priorities
+    QueueConfig(name="default", handler="handlers.default:handle_default_job"), # implies all allowed priorities
     # Example:
-    QueueConfig(name="image_processing", priorities=["high", "medium", "low"], retry_strategy="exponential"), # custom subset
+    QueueConfig(
+        name="image_processing",
+        priorities=["high", "medium", "low"],
+        retry_strategy="exponential",
+        handler="handlers.image_processing:handle_image_job"
+    ), # custom subset
     QueueConfig(name="email", priorities=["high", "default"],retry_strategy="fixed"),  # Custom subset
     QueueConfig(name="billing", retry_strategy="exponential", retry_limit=5, enable_dlq=True),
 
@@ -5,6 +5,9 @@ from pydantic import Field
 from typing import ClassVar, List
 
 class Settings(BaseSettings):
+    # Job store backend: "redis" or "memory" (in-process, single node)
+    job_store_backend: str = "redis"
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
@@ -18,6 +21,10 @@ class Settings(BaseSettings):
     default_priority: str = "medium"
     job_dlq_stream: str = "job:dlq"
 
+    # Workflow config
+    job_workflow_hash: str = "job_workflows"
+    workflow_chord_prefix: str = "workflow:chord"
+
     # Retry config
     retry_strategy: str = "exponential"  # or "fixed"
     max_retries: int = 3
@@ -25,6 +32,22 @@ class Settings(BaseSettings):
     exponential_base_delay: float = 1.0
     exponential_factor: float = 2.0
 
+    # Worker config
+    worker_queues: List[str] = []  # empty means every registered queue
+
+    # Logging config
+    log_level: str = "INFO"
+    log_mode: str = "text"  # or "async_json" (queue handler + listener thread, JSON lines)
+    log_sample_rate: float = 1.0  # fraction of jobs whose INFO lifecycle logs are kept; errors always logged
+    log_payloads: bool = False  # include job payloads in log lines
+
+    # Built-in hooks (disabled by default)
+    slow_job_threshold: float = 0.0  # seconds; 0 disables slow-job logging
+    profile_sample_rate: float = 0.0  # fraction of jobs to cProfile; 0 disables
+    profile_queues: List[str] = []  # empty means every queue
+    profile_output_dir: str = "profiles"
+    span_log_path: str = ""  # JSON-lines file for per-stage timings; empty disables
+
     ALLOWED_PRIORITIES: ClassVar[List[str]] = ["high", "medium", "low", "default"]
 
     model_config = SettingsConfigDict(
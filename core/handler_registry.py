@@ -1,5 +1,6 @@
 # core/handler_registry.py
 
+import importlib
 from typing import Callable, Dict, Optional
 
 _handler_map: Dict[str, Callable] = {}
@@ -16,6 +17,17 @@ def get_handler(queue_name: str) -> Optional[Callable]:
     """
     return _handler_map.get(queue_name)
 
+def import_handler(import_path: str) -> Callable:
+    """
+    Import a handler from a "package.module:function" (or "package.module.function") string.
+    """
+    module_path, sep, attr = import_path.partition(":")
+    if not sep:
+        module_path, _, attr = import_path.rpartition(".")
+    if not module_path or not attr:
+        raise ValueError(f"Invalid handler import string '{import_path}'. Expected 'package.module:function'")
+    return getattr(importlib.import_module(module_path), attr)
+
 def list_registered_handlers() -> Dict[str, str]:
     """
     Debug utility to list registered handlers.
@@ -0,0 +1,131 @@
+# core/hooks.py
+
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+HOOK_EVENTS = (
+    "before_claim", "after_claim", "before_dedup", "after_dedup",
+    "before_handler", "after_handler", "after_ack",
+)
+
+
+class Hook:
+    """
+    Base class for worker lifecycle hooks. Override only the events you need;
+    events left as the no-op default are never called.
+
+    - before_claim(queue_name): before the worker polls a queue for its next job (may block while idle).
+    - after_claim(queue_name, job_id): right after a job was read from its stream.
+    - before_dedup(queue_name, job_id): after the status check, right before the dedup lock is taken.
+    - after_dedup(queue_name, job_id): once the dedup lock is acquired (not called for duplicates).
+    - before_handler(queue_name, job_id, payload): after deduplication, right before the handler runs.
+    - after_handler(queue_name, job_id, payload, error): after the handler returns or raises (error is None on success).
+    - after_ack(queue_name, job_id, result): after the stream offset is committed.
+      result is one of "completed", "retrying", "failed", "duplicate" or "cancelled".
+    """
+
+    def before_claim(self, queue_name: str):
+        pass
+
+    def after_claim(self, queue_name: str, job_id: str):
+        pass
+
+    def before_dedup(self, queue_name: str, job_id: str):
+        pass
+
+    def after_dedup(self, queue_name: str, job_id: str):
+        pass
+
+    def before_handler(self, queue_name: str, job_id: str, payload: dict):
+        pass
+
+    def after_handler(self, queue_name: str, job_id: str, payload: dict, error: Optional[Exception]):
+        pass
+
+    def after_ack(self, queue_name: str, job_id: str, result: str):
+        pass
+
+
+# One list per event holding only overridden methods. Call sites keep a reference to
+# these lists and skip all work while they are empty, so unused hooks cost a truth test.
+_hook_map: Dict[str, List[Callable]] = {event: [] for event in HOOK_EVENTS}
+
+_builtin_hooks_lock = threading.Lock()
+_builtin_hooks_registered = False
+
+
+def register_hook(hook: Hook):
+    """
+    Register a hook instance for every lifecycle event it overrides.
+    """
+    for event in HOOK_EVENTS:
+        if getattr(type(hook), event) is not getattr(Hook, event):
+            _hook_map[event].append(getattr(hook, event))
+
+
+def get_hooks(event: str) -> List[Callable]:
+    """
+    Retrieve the (live) list of callbacks registered for an event.
+    """
+    return _hook_map[event]
+
+
+def clear_hooks():
+    """
+    Remove every registered hook. Lists are cleared in place so call sites stay valid.
+    """
+    global _builtin_hooks_registered
+    with _builtin_hooks_lock:
+        for callbacks in _hook_map.values():
+            callbacks.clear()
+        _builtin_hooks_registered = False
+
+
+def call_hooks(callbacks: List[Callable], *args):
+    """
+    Invoke callbacks in registration order. A failing hook is logged and never fails the job.
+    args follow the event signature: (queue_name, job_id, ...) for every event except before_claim.
+    """
+    for callback in callbacks:
+        try:
+            callback(*args)
+        except Exception as e:
+            job_id = args[1] if len(args) > 1 else None
+            logging.warning(
+                "[hooks] %s failed: %s", getattr(callback, "__qualname__", callback), e,
+                extra={"job_id": job_id}
+            )
+
+
+def register_builtin_hooks():
+    """
+    Register the built-in plugins enabled in settings. Plugins are imported only when enabled.
+    Idempotent, so several worker threads in one process share a single set of plugins.
+    """
+    global _builtin_hooks_registered
+    with _builtin_hooks_lock:
+        if _builtin_hooks_registered:
+            return
+        _builtin_hooks_registered = True
+        _register_builtin_hooks()
+
+
+def _register_builtin_hooks():
+    from config.settings import settings
+
+    if settings.slow_job_threshold > 0:
+        from plugins.slow_job import SlowJobLogHook
+        register_hook(SlowJobLogHook(settings.slow_job_threshold))
+
+    if settings.profile_sample_rate > 0:
+        from plugins.profiler import SampledProfilerHook
+        register_hook(SampledProfilerHook(
+            sample_rate=settings.profile_sample_rate,
+            queues=settings.profile_queues or None,
+            output_dir=settings.profile_output_dir,
+        ))
+
+    if settings.span_log_path:
+        from plugins.span_timing import SpanTimingHook
+        register_hook(SpanTimingHook(settings.span_log_path))
@@ -1,55 +1,92 @@
 # core/processor.py
 
 import time
-import json
 import logging
 
 from core.status import (
+    STATUS_CANCELLED,
     STATUS_IN_PROGRESS,
     STATUS_COMPLETED,
     STATUS_RETRYING,
     STATUS_FAILED
 )
-from utils.deduplication import deduplicated, get_dedup_key
-from infrastructure.redis_job_store import RedisJobStore
+from utils.deduplication import deduplicated
+from infrastructure.job_store import JobStore
 from core.handler_registry import get_handler
+from config.settings import settings
+from core.hooks import get_hooks, call_hooks
 
 class JobProcessor:
-    def __init__(self, job_store: RedisJobStore, retry_strategy):
+    def __init__(self, job_store: JobStore, retry_strategy, workflow_manager=None):
         self.job_store = job_store
         self.retry_strategy = retry_strategy
+        self.workflow_manager = workflow_manager
+        self._before_dedup_hooks = get_hooks("before_dedup")
+        self._after_dedup_hooks = get_hooks("after_dedup")
+        self._before_handler_hooks = get_hooks("before_handler")
+        self._after_handler_hooks = get_hooks("after_handler")
 
     def execute(self, queue, job_id: str, payload: dict, stream: str) -> str:
-        @deduplicated(on_first_attempt=lambda job_id: self.job_store.mark_job_status(job_id, STATUS_IN_PROGRESS))
+        def on_first_attempt(job_id: str):
+            if self._after_dedup_hooks:
+                call_hooks(self._after_dedup_hooks, queue.name, job_id)
+            self.job_store.mark_job_status(job_id, STATUS_IN_PROGRESS)
+
+        @deduplicated(self.job_store, on_first_attempt=on_first_attempt)
         def safe_process(job_id: str, payload: dict, queue_name: str):
-            logging.info(f"[processor] Processing: {job_id} -> {payload}")
-            # Simulate Failed job
-            if payload.get("fail"):
-                raise Exception("Simulated failure")
-            
-            handler = get_handler(queue_name)
-            if not handler:
-                raise ValueError(f"No handler registered for queue '{queue_name}'. Use register_handler('{queue_name}', your_function)")
-            # Call user-defined function
-            logging.info(f"[processor] Using handler: {handler.__name__} for queue: {queue_name}")
-            handler(payload)
+            if self._before_handler_hooks:
+                call_hooks(self._before_handler_hooks, queue_name, job_id, payload)
+            try:
+                self._run_handler(queue, job_id, payload)
+            except Exception as e:
+                if self._after_handler_hooks:
+                    call_hooks(self._after_handler_hooks, queue_name, job_id, payload, e)
+                raise
+            if self._after_handler_hooks:
+                call_hooks(self._after_handler_hooks, queue_name, job_id, payload, None)
 
+        if self._before_dedup_hooks:
+            call_hooks(self._before_dedup_hooks, queue.name, job_id)
         try:
             result = safe_process(job_id, payload, queue.name)
             if result == "duplicate":
                 return "duplicate"
-            self._handle_success(job_id)
+            self._handle_success(queue, job_id)
             return "completed"
         except Exception as e:
             return self._handle_failure(queue, job_id, payload, stream, e)
 
-    def _handle_success(self, job_id: str):
+    def _run_handler(self, queue, job_id: str, payload: dict):
+        queue_name = queue.name
+        log_context = {"job_id": job_id, "queue": queue_name}
+        if settings.log_payloads:
+            logging.info("[processor] Processing: %s -> %s", job_id, payload, extra=log_context)
+        else:
+            logging.info("[processor] Processing: %s", job_id, extra=log_context)
+        # Simulate Failed job
+        if payload.get("fail"):
+            raise Exception("Simulated failure")
+
+        # Handlers registered in code take precedence over the queue's import string
+        handler = get_handler(queue_name) or queue.config.get_handler()
+        if not handler:
+            raise ValueError(
+                f"No handler registered for queue '{queue_name}'. "
+                f"Use register_handler('{queue_name}', your_function) or QueueConfig(handler='module:function')"
+            )
+        # Call user-defined function
+        logging.info("[processor] Using handler: %s for queue: %s", handler.__name__, queue_name, extra=log_context)
+        handler(payload)
+
+    def _handle_success(self, queue, job_id: str):
         self.job_store.mark_job_status(job_id, STATUS_COMPLETED)
         self.job_store.clear_retry_count(job_id)
-        logging.info(f"[processor] Job {job_id} completed successfully.")
+        logging.info("[processor] Job %s completed successfully.", job_id, extra={"job_id": job_id, "queue": queue.name})
+        self.notify_workflow(job_id, STATUS_COMPLETED)
 
     def _handle_failure(self, queue, job_id: str, payload: dict, stream: str, error: Exception):
-        logging.warning(f"Job - {job_id} failed: {error}")
+        log_context = {"job_id": job_id, "queue": queue.name}
+        logging.warning("Job - %s failed: %s", job_id, error, extra=log_context)
         retries = self.job_store.increment_retry_count(job_id)
 
         if self.retry_strategy.should_retry(retries):
@@ -57,25 +94,40 @@ class JobProcessor:
 
             delay = self.retry_strategy.get_delay(retries)
             if delay > 0:
-                logging.info(f"[processor] Retrying job {job_id} after {delay} seconds...")
+                logging.info("[processor] Retrying job %s after %s seconds...", job_id, delay, extra=log_context)
                 time.sleep(delay)
 
             # Re-enqueue the job to the same stream
-            self.job_store.client.xadd(stream, {
-                "job_id": job_id,
-                "payload": json.dumps(payload)
-            })
+            self.job_store.requeue_job(stream, job_id, payload)
 
             # release deduplication lock so other workers can pick it up if the current is busy.
-            self.job_store.client.delete(get_dedup_key(job_id))
+            self.job_store.release_dedup_lock(job_id)
 
-            logging.info(f"[processor] Retried job {job_id}, attempt {retries}")
+            logging.info("[processor] Retried job %s, attempt %s", job_id, retries, extra=log_context)
             return "retrying"
         else:
             self.job_store.mark_job_status(job_id, STATUS_FAILED)
             self.job_store.clear_retry_count(job_id)
             if queue.config.enable_dlq:
                 self.job_store.send_to_dlq(job_id, payload, reason=str(error))
-            self.job_store.client.delete(get_dedup_key(job_id))  # cleanup
-            logging.error(f"[processor] Job {job_id} failed permanently.")
+            self.job_store.release_dedup_lock(job_id)  # cleanup
+            logging.error("[processor] Job %s failed permanently.", job_id, extra=log_context)
+            self.notify_workflow(job_id, STATUS_FAILED)
             return "failed"
+
+    def notify_workflow(self, job_id: str, status: str):
+        """
+        Advance, fail or cancel the chain/chord this job belongs to, based on the job's final status.
+        Errors are logged and never affect the job's own outcome or its stream acknowledgement.
+        """
+        if not self.workflow_manager:
+            return
+        try:
+            if status == STATUS_COMPLETED:
+                self.workflow_manager.on_job_completed(job_id)
+            elif status == STATUS_FAILED:
+                self.workflow_manager.on_job_failed(job_id)
+            elif status == STATUS_CANCELLED:
+                self.workflow_manager.on_job_cancelled(job_id)
+        except Exception as e:
+            logging.error("[processor] Failed to advance workflow after job %s: %s", job_id, e, extra={"job_id": job_id})
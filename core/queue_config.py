@@ -2,8 +2,9 @@
 
 import logging
 from config.settings import settings
-from infrastructure.redis_job_store import RedisJobStore
-from typing import Literal
+from infrastructure.job_store import JobStore
+from typing import Callable, Literal, Optional
+from core.handler_registry import import_handler
 
 
 class QueueConfig:
@@ -14,37 +15,53 @@ class QueueConfig:
         priorities: list[str] = None,
         retry_strategy: Literal["fixed", "exponential"] = "fixed",
         retry_limit: int = None,
-        enable_dlq: bool = True
+        enable_dlq: bool = True,
+        handler: str = None
     ):
         self.name = name
         self.priorities = [p.lower() for p in (priorities or settings.ALLOWED_PRIORITIES)]
         self.retry_strategy = retry_strategy
         self.retry_limit = retry_limit or settings.max_retries
         self.enable_dlq = enable_dlq
+        self.handler = handler  # Import string, e.g. "handlers.image_processing:handle_image_job"
+        self._resolved_handler = None
 
     @property
     def streams(self):
         """Dynamically generate stream names for each priority level."""
         return [f"disqueue:{self.name}:{p}" for p in self.priorities]
     
+    def get_handler(self) -> Optional[Callable]:
+        """
+        Resolve the handler import string on first use and cache it, so a worker
+        only imports the handlers (and their dependencies) of queues it actually processes.
+        """
+        if self._resolved_handler is None and self.handler:
+            self._resolved_handler = import_handler(self.handler)
+        return self._resolved_handler
+
     def __repr__(self):
         return (f"QueueConfig(name={self.name}, priorities={self.priorities}, "
-                f"retry_strategy={self.retry_strategy}, retry_limit={self.retry_limit})")
+                f"retry_strategy={self.retry_strategy}, retry_limit={self.retry_limit}, handler={self.handler})")
 
 
 
 class DisqueueQueue:
-    def __init__(self, config: QueueConfig, job_store: RedisJobStore):
+    def __init__(self, config: QueueConfig, job_store: JobStore):
         self.config = config
         self.job_store = job_store
-        self.client = job_store.client  # In case anything else needs the raw Redis client
+        self.client = getattr(job_store, "client", None)  # Raw Redis client, when backed by Redis
         self.name = config.name
     
     @property
     def streams(self):
         return self.config.streams
 
-    def enqueue(self, job_id: str, payload: dict, priority: str = "default") -> bool:
+    def enqueue(self, job_id: str, payload: dict, priority: str = "default", unless_cancelled: bool = False) -> bool:
+        """
+        unless_cancelled: atomically skip the job if it was already cancelled (used for workflow steps).
+        In that case False means the job was cancelled rather than failed to enqueue.
+        """
         priority = priority.lower()
         if priority not in self.config.priorities:
             raise ValueError(
@@ -53,8 +70,9 @@ class DisqueueQueue:
             )
         
         stream_name = f"disqueue:{self.name}:{priority}"
-        logging.debug(f"[enqueue] Enqueuing job {job_id} to stream {stream_name} with priority {priority}")
-        return self.job_store.enqueue_job(
+        logging.debug("[enqueue] Enqueuing job %s to stream %s with priority %s", job_id, stream_name, priority, extra={"job_id": job_id})
+        enqueue = self.job_store.enqueue_job_unless_cancelled if unless_cancelled else self.job_store.enqueue_job
+        return enqueue(
             stream_name=stream_name,
             job_id=job_id,
             payload=payload,
@@ -2,8 +2,7 @@
 
 from config.queue_registry import REGISTERED_QUEUES
 from core.queue_config import DisqueueQueue
-from infrastructure.redis_conn import redis_client
-from infrastructure.redis_job_store import RedisJobStore
+from infrastructure.factory import get_job_store
 
 def get_registered_queues(job_store=None):
     """
@@ -11,5 +10,5 @@ def get_registered_queues(job_store=None):
     and returns a list of initialized DisqueueQueue instances.
     Allows injecting a custom job_store for testing and flexibility.
     """
-    job_store = job_store or RedisJobStore(redis_client)
+    job_store = job_store or get_job_store()
     return [DisqueueQueue(config, job_store) for config in REGISTERED_QUEUES]
@@ -1,5 +1,6 @@
 # core/status_codes.py
 
+STATUS_WAITING = "waiting"  # Workflow step not yet enqueued
 STATUS_QUEUED = "queued"
 STATUS_IN_PROGRESS = "in_progress"
 STATUS_RETRYING = "retrying"
@@ -1,10 +1,10 @@
 # core/stream_manager.py
 
 import logging
-from infrastructure.redis_job_store import RedisJobStore
+from infrastructure.job_store import JobStore
 
 class QueueStreamManager:
-    def __init__(self, queue, job_store: RedisJobStore):
+    def __init__(self, queue, job_store: JobStore):
         self.queue = queue
         self.job_store = job_store
         self.streams = queue.streams
@@ -23,7 +23,7 @@ class QueueStreamManager:
                     msg_id, msg_data = result
                     return stream, msg_id, msg_data
             except Exception as e:
-                logging.error(f"[stream] Error reading from stream {stream}: {e}")
+                logging.error("[stream] Error reading from stream %s: %s", stream, e)
                 continue
         return None
 
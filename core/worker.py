@@ -1,47 +1,74 @@
 # core/worker.py
 
+import argparse
 import json
 import time
 import logging
 import signal
+import sys
 import threading
 
-import handlers.registry  # Triggers registration of predefined handlers on start 
-
 from core.stream_manager import QueueStreamManager
 from core.processor import JobProcessor
 from core.status import STATUS_CANCELLED
 from core.registry import get_registered_queues
+from core.workflow import WorkflowManager
+from core.hooks import get_hooks, call_hooks, register_builtin_hooks
 
-from infrastructure.redis_conn import redis_client
-from infrastructure.redis_job_store import RedisJobStore
+from infrastructure.factory import get_job_store
 
 from config.logging_config import configure_logging
+from config.settings import settings
 from retry.factory import get_retry_strategy
 
 
-configure_logging()
-
-
 # Thread-safe event flag for shutdown
 shutdown_event = threading.Event()
 
+
+class NoQueuesError(Exception):
+    """Raised by start_worker when no registered queue matches the requested filter."""
+
+
 def handle_shutdown_signal(signum, frame):
     logging.info(f"\n[signal] Received shutdown signal ({signum}). Finishing current job then exiting...")
     shutdown_event.set()
 
-# Register signal handlers
-signal.signal(signal.SIGINT, handle_shutdown_signal)
-signal.signal(signal.SIGTERM, handle_shutdown_signal)
 
-
-def start_worker():
+def start_worker(job_store=None, queue_names=None):
+    """
+    Run the worker loop until shutdown_event is set.
+    queue_names limits the worker to those queues; handlers of other queues are never imported.
+    Raises NoQueuesError if no registered queue is left to process.
+    """
     logging.info("[worker] Starting worker...")
 
-    job_store = RedisJobStore(redis_client)
+    job_store = job_store or get_job_store()
+
+    register_builtin_hooks()
+    before_claim_hooks = get_hooks("before_claim")
+    after_claim_hooks = get_hooks("after_claim")
+    after_ack_hooks = get_hooks("after_ack")
 
-    queues = get_registered_queues(job_store)  # returns list[DisqueueQueue]
-    logging.info(f"Registered queues: {[q.name for q in queues]}")
+    all_queues = get_registered_queues(job_store)  # returns list[DisqueueQueue]
+    logging.info(f"Registered queues: {[q.name for q in all_queues]}")
+
+    queues = all_queues
+    if queue_names:
+        unknown = set(queue_names) - {q.name for q in all_queues}
+        if unknown:
+            logging.warning(f"[worker] Ignoring unknown queues: {sorted(unknown)}")
+        queues = [q for q in all_queues if q.name in queue_names]
+        logging.info(f"[worker] Processing only queues: {[q.name for q in queues]}")
+
+    if not queues:
+        # An empty loop would spin without ever sleeping
+        logging.error(f"[worker] No queues to process (requested: {queue_names}). Exiting.")
+        raise NoQueuesError(f"No registered queues match {queue_names}")
+
+    # Lets this worker enqueue the next chain step / chord callback on completion.
+    # Uses every queue, since a workflow step may target a queue this worker does not process.
+    workflow_manager = WorkflowManager(all_queues, job_store)
 
     # Create stream managers and processors for each queue
     queue_contexts = []
@@ -51,12 +78,15 @@ def start_worker():
             strategy_name = queue.config.retry_strategy,
             retry_limit = queue.config.retry_limit
             )
-        processor = JobProcessor(job_store, retry_strategy)
+        processor = JobProcessor(job_store, retry_strategy, workflow_manager)
         queue_contexts.append((queue, stream_manager, processor))
     
     while not shutdown_event.is_set():
         try:
             for queue, stream_manager, processor in queue_contexts:
+                if before_claim_hooks:
+                    call_hooks(before_claim_hooks, queue.name)
+
                 result = stream_manager.get_next_job()
                 if not result:
                     time.sleep(0.1)  # small cooldown to avoid CPU spin
@@ -65,26 +95,56 @@ def start_worker():
                 stream, msg_id, msg_data = result
 
                 job_id = msg_data.get("job_id")
+                if after_claim_hooks:
+                    call_hooks(after_claim_hooks, queue.name, job_id)
                 payload = json.loads(msg_data.get("payload", "{}"))
 
-                logging.info(f"[worker] Received job {job_id} from {stream}")
+                logging.info(
+                    "[worker] Received job %s from %s", job_id, stream,
+                    extra={"job_id": job_id, "queue": queue.name, "stream": stream}
+                )
 
                 current_status = job_store.get_job_status(job_id)
                 if current_status == STATUS_CANCELLED:
-                    logging.info(f"[worker] Skipping cancelled job {job_id}")
+                    logging.info("[worker] Skipping cancelled job %s", job_id, extra={"job_id": job_id, "queue": queue.name})
+                    processor.notify_workflow(job_id, STATUS_CANCELLED)
                     stream_manager.mark_processed(stream, msg_id)
+                    if after_ack_hooks:
+                        call_hooks(after_ack_hooks, queue.name, job_id, STATUS_CANCELLED)
                     continue  # Skip processing this job
 
                 result = processor.execute(queue, job_id, payload, stream)
 
                 # Regardless of success/failure/duplicate, we mark the message as handled
                 stream_manager.mark_processed(stream, msg_id)
+                if after_ack_hooks:
+                    call_hooks(after_ack_hooks, queue.name, job_id, result)
 
         except Exception as e:
-            logging.error(f"[worker] Error during job processing loop: {e}")
+            logging.error("[worker] Error during job processing loop: %s", e)
             time.sleep(1)
             
     logging.info("[worker] Graceful shutdown complete.")
 
+def main():
+    parser = argparse.ArgumentParser(description="Disqueue worker")
+    parser.add_argument(
+        "--queues",
+        help="Comma-separated queue names to process (default: WORKER_QUEUES setting, or all queues)",
+    )
+    args = parser.parse_args()
+    queue_names = args.queues.split(",") if args.queues else settings.worker_queues
+
+    configure_logging()
+
+    # Register signal handlers
+    signal.signal(signal.SIGINT, handle_shutdown_signal)
+    signal.signal(signal.SIGTERM, handle_shutdown_signal)
+
+    try:
+        start_worker(queue_names=queue_names or None)
+    except NoQueuesError:
+        sys.exit(1)
+
 if __name__ == "__main__":
-    start_worker()
+    main()
@@ -0,0 +1,207 @@
+# core/workflow.py
+
+import logging
+from typing import List
+from uuid import uuid4
+
+from config.settings import settings
+from core.status import STATUS_CANCELLED, STATUS_FAILED, STATUS_WAITING
+
+
+class WorkflowEnqueueError(Exception):
+    """Raised when a workflow step could not be written to its stream."""
+
+
+class JobSignature:
+    """
+    Describes a job that can be enqueued later as a workflow step.
+    The job_id is assigned up front so clients can track every step immediately.
+    """
+
+    def __init__(self, queue_name: str, payload: dict, priority: str = settings.default_priority, job_id: str = None):
+        self.queue_name = queue_name
+        self.payload = payload
+        self.priority = priority.lower()
+        self.job_id = job_id or str(uuid4())
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "queue_name": self.queue_name,
+            "payload": self.payload,
+            "priority": self.priority,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobSignature":
+        return cls(
+            queue_name=data["queue_name"],
+            payload=data["payload"],
+            priority=data["priority"],
+            job_id=data["job_id"],
+        )
+
+    def __repr__(self):
+        return f"JobSignature(job_id={self.job_id}, queue_name={self.queue_name}, priority={self.priority})"
+
+
+class WorkflowManager:
+    """
+    Server-side orchestration of chains, groups and chords on top of DisqueueQueue.enqueue.
+
+    - chain: steps run one after another; the worker enqueues the next step when the previous completes.
+    - group: jobs are enqueued at once and run in parallel.
+    - chord: a group plus a callback; the worker that completes the last member enqueues the callback.
+
+    Downstream steps are tracked with status "waiting" until they are enqueued.
+    If a step cannot be enqueued, it and every step depending on it are marked "failed",
+    so nothing is left waiting for a job that will never run.
+    """
+
+    def __init__(self, queues, job_store):
+        self.queue_map = {q.name: q for q in queues}
+        self.job_store = job_store
+
+    def enqueue_chain(self, steps: List[JobSignature]) -> List[str]:
+        if not steps:
+            raise ValueError("A chain needs at least one step.")
+        self._validate(steps)
+
+        first, rest = steps[0], steps[1:]
+        for step in rest:
+            self.job_store.mark_job_status(step.job_id, STATUS_WAITING)
+        if rest:
+            self.job_store.set_job_workflow(first.job_id, {"chain": [s.to_dict() for s in rest]})
+
+        if not self._enqueue(first):
+            self.job_store.pop_job_workflow(first.job_id)
+            self._fail_steps(steps)
+            raise WorkflowEnqueueError(f"Failed to enqueue chain step {first.job_id}")
+        return [s.job_id for s in steps]
+
+    def enqueue_group(self, jobs: List[JobSignature]) -> List[str]:
+        self._validate(jobs)
+        for index, job in enumerate(jobs):
+            if not self._enqueue(job):
+                # Jobs enqueued before the failure still run; the rest never will.
+                self._fail_steps(jobs[index:])
+                raise WorkflowEnqueueError(f"Failed to enqueue group job {job.job_id}")
+        return [j.job_id for j in jobs]
+
+    def enqueue_chord(self, jobs: List[JobSignature], callback: JobSignature) -> str:
+        self._validate(jobs + [callback])
+
+        if not jobs:
+            raise ValueError("A chord needs at least one job.")
+
+        chord_id = str(uuid4())
+        self.job_store.mark_job_status(callback.job_id, STATUS_WAITING)
+        # Counter must exist before any member can complete.
+        self.job_store.create_chord(chord_id, len(jobs), callback.to_dict())
+        for index, job in enumerate(jobs):
+            self.job_store.set_job_workflow(job.job_id, {"chord": chord_id})
+            if not self._enqueue(job):
+                # The counter can never reach zero now. Members already enqueued still run,
+                # but find no chord on completion.
+                self.job_store.discard_chord(chord_id)
+                for member in jobs[index:]:
+                    self.job_store.pop_job_workflow(member.job_id)
+                self._fail_steps(jobs[index:] + [callback])
+                raise WorkflowEnqueueError(f"Failed to enqueue chord job {job.job_id}")
+        return chord_id
+
+    def on_job_completed(self, job_id: str):
+        """Called by the worker after a job succeeds. Advances the job's chain or chord, if any."""
+        workflow = self.job_store.pop_job_workflow(job_id)
+        if not workflow:
+            return
+
+        if workflow.get("chain"):
+            self._advance_chain([JobSignature.from_dict(s) for s in workflow["chain"]])
+
+        if workflow.get("chord"):
+            callback = self.job_store.complete_chord_member(workflow["chord"])
+            if callback:
+                # The chord counter is gone by now, so a failed enqueue must fail the callback.
+                try:
+                    self._enqueue_if_not_cancelled(JobSignature.from_dict(callback))
+                except Exception:
+                    self._fail_steps([JobSignature.from_dict(callback)])
+                    raise
+
+    def on_job_failed(self, job_id: str):
+        """Called by the worker after a job fails permanently. Fails every step that depended on it."""
+        self._abort(job_id, STATUS_FAILED)
+
+    def on_job_cancelled(self, job_id: str):
+        """Called by the worker when it skips a cancelled job. Cancels every step that depended on it."""
+        self._abort(job_id, STATUS_CANCELLED)
+
+    def _abort(self, job_id: str, status: str):
+        workflow = self.job_store.pop_job_workflow(job_id)
+        if not workflow:
+            return
+
+        for step in workflow.get("chain") or []:
+            self.job_store.mark_job_status(step["job_id"], status)
+
+        if workflow.get("chord"):
+            callback = self.job_store.discard_chord(workflow["chord"])
+            if callback:
+                self.job_store.mark_job_status(callback["job_id"], status)
+                logging.warning(
+                    "[workflow] Chord callback %s %s: member %s %s", callback["job_id"], status, job_id, status,
+                    extra={"job_id": callback["job_id"]}
+                )
+
+    def _advance_chain(self, steps: List[JobSignature]):
+        next_step, rest = steps[0], steps[1:]
+        # The previous step's metadata is already popped, so on a storage error the
+        # remaining steps are failed rather than left waiting forever.
+        try:
+            if rest:
+                self.job_store.set_job_workflow(next_step.job_id, {"chain": [s.to_dict() for s in rest]})
+            enqueued = self._enqueue_if_not_cancelled(next_step)
+        except Exception:
+            self._fail_steps(steps)
+            raise
+
+        if not enqueued:
+            for step in rest:
+                self.job_store.mark_job_status(step.job_id, STATUS_CANCELLED)
+            self.job_store.pop_job_workflow(next_step.job_id)
+
+    def _fail_steps(self, signatures: List[JobSignature]):
+        for signature in signatures:
+            self.job_store.mark_job_status(signature.job_id, STATUS_FAILED)
+        logging.error(
+            "[workflow] Failed to enqueue step %s; marked %d step(s) failed: %s",
+            signatures[0].job_id, len(signatures), [s.job_id for s in signatures],
+            extra={"job_id": signatures[0].job_id}
+        )
+
+    def _enqueue_if_not_cancelled(self, signature: JobSignature) -> bool:
+        # The status check and the enqueue happen atomically in the store, so a cancel
+        # arriving from the API at the same time is never overwritten with "queued".
+        queue = self.queue_map[signature.queue_name]
+        if not queue.enqueue(signature.job_id, signature.payload, signature.priority, unless_cancelled=True):
+            logging.info("[workflow] Step %s was cancelled. Stopping workflow.", signature.job_id, extra={"job_id": signature.job_id})
+            return False
+        return True
+
+    def _enqueue(self, signature: JobSignature) -> bool:
+        queue = self.queue_map[signature.queue_name]
+        logging.debug("[workflow] Enqueuing step %s to queue %s", signature.job_id, signature.queue_name, extra={"job_id": signature.job_id})
+        return queue.enqueue(signature.job_id, signature.payload, signature.priority)
+
+    def _validate(self, signatures: List[JobSignature]):
+        # Validate every step up front so a bad step never leaves a half-started workflow.
+        for signature in signatures:
+            queue = self.queue_map.get(signature.queue_name)
+            if not queue:
+                raise ValueError(f"Queue '{signature.queue_name}' not registered.")
+            if signature.priority not in queue.config.priorities:
+                raise ValueError(
+                    f"Priority '{signature.priority}' not allowed in queue '{queue.name}'. "
+                    f"Allowed priorities: {queue.config.priorities}"
+                )
@@ -0,0 +1,8 @@
+# handlers/default.py
+
+import time
+import logging
+
+def handle_default_job(payload):
+    logging.info("[Handler:default] Processing job")
+    time.sleep(payload.get("duration", 30))  # simulated work
@@ -0,0 +1,8 @@
+# handlers/image_processing.py
+
+import time
+import logging
+
+def handle_image_job(payload):
+    logging.info("[Handler:image_processing] Handling image task")
+    time.sleep(payload.get("duration", 30))  # simulated work
@@ -0,0 +1,29 @@
+# infrastructure/factory.py
+import threading
+
+from config.settings import settings
+from infrastructure.job_store import JobStore
+
+_job_store = None
+_job_store_lock = threading.Lock()
+
+def get_job_store() -> JobStore:
+    """
+    Returns the process-wide JobStore for the configured backend.
+    The instance is shared so an in-memory producer and its workers see the same queues.
+    """
+    global _job_store
+    if _job_store is None:
+        # FastAPI resolves sync dependencies in a threadpool, so first requests can race here.
+        with _job_store_lock:
+            if _job_store is None:
+                _job_store = _create_job_store()
+    return _job_store
+
+def _create_job_store() -> JobStore:
+    if settings.job_store_backend.lower() == "memory":
+        from infrastructure.memory_job_store import InMemoryJobStore
+        return InMemoryJobStore()
+    from infrastructure.redis_conn import get_redis_client
+    from infrastructure.redis_job_store import RedisJobStore
+    return RedisJobStore(get_redis_client())
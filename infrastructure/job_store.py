@@ -0,0 +1,114 @@
+# infrastructure/job_store.py
+
+import abc
+from typing import Optional, Tuple
+
+from config.settings import settings
+
+
+class JobStore(abc.ABC):
+    """
+    Storage interface used by the worker, the API and the deduplication decorator.
+    Implementations: RedisJobStore (default) and InMemoryJobStore (single process).
+
+    Streams are append-only logs per queue priority. Message IDs must compare in
+    insertion order so a reader can resume strictly after the last processed ID.
+    """
+
+    # Streams
+    @abc.abstractmethod
+    def enqueue_job(self, stream_name: str, job_id: str, payload: dict, priority: str = settings.default_priority) -> bool:
+        """Appends a job to a stream, marks it queued and resets its retry count."""
+
+    @abc.abstractmethod
+    def enqueue_job_unless_cancelled(self, stream_name: str, job_id: str, payload: dict, priority: str = settings.default_priority) -> bool:
+        """
+        Same as enqueue_job, but atomically skips jobs whose status is already "cancelled".
+        Returns True if the job was enqueued, False if it was cancelled. Storage errors are raised.
+        """
+
+    @abc.abstractmethod
+    def requeue_job(self, stream_name: str, job_id: str, payload: dict):
+        """Appends a job to a stream again (retry), leaving its status and retry count untouched."""
+
+    @abc.abstractmethod
+    def read_from_stream(self, stream: str, last_id: str) -> Optional[Tuple[str, dict]]:
+        """Returns the first (msg_id, msg_data) after last_id, waiting briefly, or None."""
+
+    # Status
+    @abc.abstractmethod
+    def get_job_status(self, job_id: str) -> Optional[str]:
+        pass
+
+    @abc.abstractmethod
+    def mark_job_status(self, job_id: str, status: str):
+        pass
+
+    @abc.abstractmethod
+    def cancel_job(self, job_id: str) -> bool:
+        pass
+
+    # Retries
+    @abc.abstractmethod
+    def increment_retry_count(self, job_id: str) -> int:
+        pass
+
+    @abc.abstractmethod
+    def get_retry_count(self, job_id: str) -> int:
+        pass
+
+    @abc.abstractmethod
+    def clear_retry_count(self, job_id: str):
+        pass
+
+    # Stream offsets
+    @abc.abstractmethod
+    def get_last_id(self, stream: str) -> str:
+        pass
+
+    @abc.abstractmethod
+    def set_last_id(self, stream: str, msg_id: str):
+        pass
+
+    @abc.abstractmethod
+    def clear_all_last_ids(self):
+        pass
+
+    # Dead-letter queue
+    @abc.abstractmethod
+    def send_to_dlq(self, job_id: str, payload: dict, reason: str = "Maximum retries exceeded"):
+        pass
+
+    # Deduplication
+    @abc.abstractmethod
+    def acquire_dedup_lock(self, job_id: str, ttl_seconds: int) -> bool:
+        """Sets the dedup key only if absent. Returns True for the first attempt."""
+
+    @abc.abstractmethod
+    def mark_dedup_done(self, job_id: str, ttl_seconds: int):
+        pass
+
+    @abc.abstractmethod
+    def release_dedup_lock(self, job_id: str):
+        pass
+
+    # Workflows
+    @abc.abstractmethod
+    def set_job_workflow(self, job_id: str, workflow: dict):
+        pass
+
+    @abc.abstractmethod
+    def pop_job_workflow(self, job_id: str) -> Optional[dict]:
+        pass
+
+    @abc.abstractmethod
+    def create_chord(self, chord_id: str, pending: int, callback: dict):
+        pass
+
+    @abc.abstractmethod
+    def complete_chord_member(self, chord_id: str) -> Optional[dict]:
+        """Atomically decrements the chord counter; returns the callback only to the caller that reaches zero."""
+
+    @abc.abstractmethod
+    def discard_chord(self, chord_id: str) -> Optional[dict]:
+        pass
@@ -0,0 +1,210 @@
+# infrastructure/memory_job_store.py
+
+import heapq
+import json
+import logging
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from core.status import STATUS_QUEUED, STATUS_CANCELLED
+from config.settings import settings
+from infrastructure.job_store import JobStore
+
+
+class InMemoryJobStore(JobStore):
+    """
+    In-process JobStore for single-node deployments and tests. Producer and workers
+    must share the same instance (see infrastructure.factory.get_job_store).
+
+    Mirrors RedisJobStore semantics:
+    - each stream is a deque of (seq, msg_data); message IDs are "<seq>-0" so they
+      compare like Redis stream IDs, and entries are trimmed once their offset is committed.
+    - payloads are stored JSON-encoded, exactly as in the Redis stream fields.
+    - dedup locks honour their TTL and expired ones are evicted (a heap of expiry times is
+      drained on every acquire), chord counters are decremented under the store lock.
+
+    A single condition variable guards all state, so every method is atomic and
+    read_from_stream can block until a producer appends.
+    """
+
+    def __init__(self, block_seconds: float = 1.0):
+        self.block_seconds = block_seconds
+        self._cond = threading.Condition()
+
+        self._streams: Dict[str, deque] = {}
+        self._next_seq: Dict[str, int] = {}
+        self._statuses: Dict[str, str] = {}
+        self._retries: Dict[str, int] = {}
+        self._last_ids: Dict[str, str] = {}
+        self._dedup: Dict[str, Tuple[str, float]] = {}  # job_id -> (state, expires_at)
+        self._dedup_expiry: List[Tuple[float, str]] = []  # heap of (expires_at, job_id); may hold stale items
+        self._workflows: Dict[str, str] = {}
+        self._chords: Dict[str, dict] = {}
+        self.dlq: List[dict] = []
+
+
+    def _append(self, stream_name: str, msg_data: dict) -> str:
+        seq = self._next_seq.get(stream_name, 0) + 1
+        self._next_seq[stream_name] = seq
+        self._streams.setdefault(stream_name, deque()).append((seq, msg_data))
+        self._cond.notify_all()
+        return f"{seq}-0"
+
+    def enqueue_job(self, stream_name: str, job_id: str, payload: dict, priority: str = settings.default_priority) -> bool:
+        priority = priority.lower()
+        with self._cond:
+            self._append(stream_name, {"job_id": job_id, "payload": json.dumps(payload), "priority": priority})
+            self._statuses[job_id] = STATUS_QUEUED
+            self._retries[job_id] = 0
+        return True
+
+    def enqueue_job_unless_cancelled(self, stream_name: str, job_id: str, payload: dict, priority: str = settings.default_priority) -> bool:
+        with self._cond:
+            if self._statuses.get(job_id) == STATUS_CANCELLED:
+                return False
+            return self.enqueue_job(stream_name, job_id, payload, priority)
+
+    def requeue_job(self, stream_name: str, job_id: str, payload: dict):
+        with self._cond:
+            self._append(stream_name, {"job_id": job_id, "payload": json.dumps(payload)})
+
+    def read_from_stream(self, stream: str, last_id: str) -> Optional[Tuple[str, dict]]:
+        after = _seq(last_id)
+        deadline = time.monotonic() + self.block_seconds
+        with self._cond:
+            while True:
+                for seq, msg_data in self._streams.get(stream, ()):
+                    if seq > after:
+                        return f"{seq}-0", dict(msg_data)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+
+    def get_job_status(self, job_id: str) -> Optional[str]:
+        with self._cond:
+            return self._statuses.get(job_id)
+
+    def mark_job_status(self, job_id: str, status: str):
+        with self._cond:
+            self._statuses[job_id] = status
+
+    def cancel_job(self, job_id: str) -> bool:
+        with self._cond:
+            if job_id not in self._statuses:
+                logging.warning("[cancel_job] Job %s not found.", job_id)
+                return False
+            self._statuses[job_id] = STATUS_CANCELLED
+        logging.info("[cancel_job] Job %s cancelled.", job_id)
+        return True
+
+
+    # Retry helpers
+    def increment_retry_count(self, job_id: str) -> int:
+        with self._cond:
+            self._retries[job_id] = self._retries.get(job_id, 0) + 1
+            return self._retries[job_id]
+
+    def get_retry_count(self, job_id: str) -> int:
+        with self._cond:
+            return self._retries.get(job_id, 0)
+
+    def clear_retry_count(self, job_id: str):
+        with self._cond:
+            self._retries.pop(job_id, None)
+
+
+    # last ids helpers
+    def get_last_id(self, stream: str) -> str:
+        with self._cond:
+            return self._last_ids.get(stream, "0")
+
+    def set_last_id(self, stream: str, msg_id: str):
+        committed = _seq(msg_id)
+        with self._cond:
+            self._last_ids[stream] = msg_id
+            # Processed entries can never be read again; drop them to bound memory.
+            entries = self._streams.get(stream)
+            while entries and entries[0][0] <= committed:
+                entries.popleft()
+
+    def clear_all_last_ids(self):
+        # Entries are trimmed on commit, so only messages still in memory can be replayed.
+        with self._cond:
+            self._last_ids.clear()
+
+
+    def send_to_dlq(self, job_id: str, payload: dict, reason: str = "Maximum retries exceeded"):
+        with self._cond:
+            self.dlq.append({"job_id": job_id, "payload": json.dumps(payload), "reason": reason})
+        logging.info("[DLQ] Job %s moved to DLQ: %s", job_id, reason, extra={"job_id": job_id})
+
+
+    # deduplication helpers
+    def _set_dedup(self, job_id: str, state: str, expires_at: float):
+        self._dedup[job_id] = (state, expires_at)
+        heapq.heappush(self._dedup_expiry, (expires_at, job_id))
+
+    def _purge_expired_dedup(self, now: float):
+        # Heap items are not removed on overwrite/release, so only evict when the
+        # item still matches the live entry's expiry.
+        heap = self._dedup_expiry
+        while heap and heap[0][0] <= now:
+            expires_at, job_id = heapq.heappop(heap)
+            entry = self._dedup.get(job_id)
+            if entry and entry[1] == expires_at:
+                del self._dedup[job_id]
+
+    def acquire_dedup_lock(self, job_id: str, ttl_seconds: int) -> bool:
+        now = time.monotonic()
+        with self._cond:
+            self._purge_expired_dedup(now)
+            if job_id in self._dedup:
+                return False
+            self._set_dedup(job_id, "processing", now + ttl_seconds)
+            return True
+
+    def mark_dedup_done(self, job_id: str, ttl_seconds: int):
+        with self._cond:
+            self._set_dedup(job_id, "done", time.monotonic() + ttl_seconds)
+
+    def release_dedup_lock(self, job_id: str):
+        with self._cond:
+            self._dedup.pop(job_id, None)
+
+
+    # workflow helpers
+    def set_job_workflow(self, job_id: str, workflow: dict):
+        with self._cond:
+            self._workflows[job_id] = json.dumps(workflow)
+
+    def pop_job_workflow(self, job_id: str) -> Optional[dict]:
+        with self._cond:
+            raw = self._workflows.pop(job_id, None)
+        return json.loads(raw) if raw else None
+
+    def create_chord(self, chord_id: str, pending: int, callback: dict):
+        with self._cond:
+            self._chords[chord_id] = {"pending": pending, "callback": json.dumps(callback)}
+
+    def complete_chord_member(self, chord_id: str) -> Optional[dict]:
+        with self._cond:
+            chord = self._chords.get(chord_id)
+            if not chord:
+                return None
+            chord["pending"] -= 1
+            if chord["pending"] > 0:
+                return None
+            del self._chords[chord_id]
+        return json.loads(chord["callback"])
+
+    def discard_chord(self, chord_id: str) -> Optional[dict]:
+        with self._cond:
+            chord = self._chords.pop(chord_id, None)
+        return json.loads(chord["callback"]) if chord else None
+
+
+def _seq(msg_id: str) -> int:
+    return int(msg_id.split("-", 1)[0])
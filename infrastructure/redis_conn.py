@@ -1,4 +1,19 @@
-import redis
+# infrastructure/redis_conn.py
+
+from functools import lru_cache
 from config.settings import settings
 
-redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+@lru_cache(maxsize=None)
+def get_redis_client():
+    """
+    Creates the Redis client on first use. Importing this module neither imports
+    redis nor opens a connection, which keeps worker and API cold starts fast.
+    """
+    import redis
+    return redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+
+def __getattr__(name):
+    # Backwards compatibility for `from infrastructure.redis_conn import redis_client`
+    if name == "redis_client":
+        return get_redis_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,19 +6,33 @@ from typing import Optional, Tuple
 
 from core.status import STATUS_QUEUED, STATUS_CANCELLED
 from config.settings import settings
-from config.logging_config import configure_logging
+from infrastructure.job_store import JobStore
+from utils.deduplication import get_dedup_key
 
 
-configure_logging()
+# Check-and-enqueue in one round trip so a concurrent cancel cannot be overwritten with "queued".
+# KEYS: status hash, retry hash, stream. ARGV: job_id, payload, priority.
+_ENQUEUE_UNLESS_CANCELLED = f"""
+if redis.call('HGET', KEYS[1], ARGV[1]) == '{STATUS_CANCELLED}' then
+    return 0
+end
+redis.call('XADD', KEYS[3], '*', 'job_id', ARGV[1], 'payload', ARGV[2], 'priority', ARGV[3])
+redis.call('HSET', KEYS[1], ARGV[1], '{STATUS_QUEUED}')
+redis.call('HSET', KEYS[2], ARGV[1], 0)
+return 1
+"""
 
 
-class RedisJobStore:
+class RedisJobStore(JobStore):
     def __init__(self, client):
         self.client = client
         self.job_status_hash = settings.job_status_hash
         self.job_retry_hash = settings.job_retry_hash
         self.job_last_id_hash = settings.job_last_ids_hash
         self.dlq_stream = settings.job_dlq_stream
+        self.job_workflow_hash = settings.job_workflow_hash
+        self.chord_prefix = settings.workflow_chord_prefix
+        self._enqueue_unless_cancelled = client.register_script(_ENQUEUE_UNLESS_CANCELLED)
 
 
     def enqueue_job(self, stream_name: str, job_id: str, payload: dict, priority: str = settings.default_priority) -> bool:
@@ -38,9 +52,22 @@ class RedisJobStore:
             self.client.hset(self.job_retry_hash, job_id, 0)
             return True
         except Exception as e:
-            logging.error(f"[enqueue_job] Error enqueueing job {job_id} to {stream_name}", exc_info=True)
+            logging.error("[enqueue_job] Error enqueueing job %s to %s", job_id, stream_name, exc_info=True, extra={"job_id": job_id})
             return False
     
+    def enqueue_job_unless_cancelled(self, stream_name: str, job_id: str, payload: dict, priority: str = settings.default_priority) -> bool:
+        enqueued = self._enqueue_unless_cancelled(
+            keys=[self.job_status_hash, self.job_retry_hash, stream_name],
+            args=[job_id, json.dumps(payload), priority.lower()],
+        )
+        return bool(enqueued)
+
+    def requeue_job(self, stream_name: str, job_id: str, payload: dict):
+        self.client.xadd(stream_name, {
+            "job_id": job_id,
+            "payload": json.dumps(payload)
+        })
+
     def read_from_stream(self, stream: str, last_id: str) -> Optional[Tuple[str, dict]]:
         """
         Reads a message from a Redis stream after the given ID.
@@ -55,7 +82,7 @@ class RedisJobStore:
                 _, messages = res[0]
                 return messages[0]  # msg_id, msg_data
         except Exception as e:
-            logging.error(f"[read_from_stream] Error reading from stream {stream}: {e}")
+            logging.error("[read_from_stream] Error reading from stream %s: %s", stream, e)
         return None
     
     def get_job_status(self, job_id: str) -> str:
@@ -102,6 +129,65 @@ class RedisJobStore:
 
 
 
+    # deduplication helpers
+    def acquire_dedup_lock(self, job_id: str, ttl_seconds: int) -> bool:
+        return bool(self.client.set(get_dedup_key(job_id), "processing", nx=True, ex=ttl_seconds))
+
+    def mark_dedup_done(self, job_id: str, ttl_seconds: int):
+        self.client.set(get_dedup_key(job_id), "done", ex=ttl_seconds)
+
+    def release_dedup_lock(self, job_id: str):
+        self.client.delete(get_dedup_key(job_id))
+
+
+    # workflow helpers
+    def set_job_workflow(self, job_id: str, workflow: dict):
+        """Attach workflow metadata (next chain steps, parent chord) to a job."""
+        self.client.hset(self.job_workflow_hash, job_id, json.dumps(workflow))
+
+    def pop_job_workflow(self, job_id: str) -> Optional[dict]:
+        """
+        Atomically reads and removes the workflow metadata of a job.
+        Returns None if the job is not part of a workflow.
+        """
+        pipe = self.client.pipeline()
+        pipe.hget(self.job_workflow_hash, job_id)
+        pipe.hdel(self.job_workflow_hash, job_id)
+        raw, _ = pipe.execute()
+        return json.loads(raw) if raw else None
+
+    def create_chord(self, chord_id: str, pending: int, callback: dict):
+        """Stores the chord callback together with its pending member counter."""
+        self.client.hset(f"{self.chord_prefix}:{chord_id}", mapping={
+            "pending": pending,
+            "callback": json.dumps(callback),
+        })
+
+    def complete_chord_member(self, chord_id: str) -> Optional[dict]:
+        """
+        Decrements the chord counter. HINCRBY is atomic, so exactly one worker
+        observes zero and receives the callback; every other call returns None.
+        """
+        key = f"{self.chord_prefix}:{chord_id}"
+        remaining = self.client.hincrby(key, "pending", -1)
+        if remaining < 0:
+            # Chord already fired or never existed; drop the key HINCRBY just created.
+            self.client.delete(key)
+            return None
+        if remaining > 0:
+            return None
+        return self.discard_chord(chord_id)
+
+    def discard_chord(self, chord_id: str) -> Optional[dict]:
+        """Removes the chord and returns its callback, or None if it was already removed."""
+        key = f"{self.chord_prefix}:{chord_id}"
+        pipe = self.client.pipeline()
+        pipe.hget(key, "callback")
+        pipe.delete(key)
+        callback, _ = pipe.execute()
+        return json.loads(callback) if callback else None
+
+
     def send_to_dlq(self, job_id: str, payload: dict, reason: str = "Maximum retries exceeded"):
         try:
             dlq_payload = {
@@ -110,9 +196,9 @@ class RedisJobStore:
                 "reason": reason,
             }
             self.client.xadd(self.dlq_stream, dlq_payload)
-            logging.info(f"[DLQ] Job {job_id} moved to DLQ: {reason}")
+            logging.info("[DLQ] Job %s moved to DLQ: %s", job_id, reason, extra={"job_id": job_id})
         except Exception as e:
-            logging.error(f"[DLQ] Failed to enqueue job {job_id} to DLQ: {e}")
+            logging.error("[DLQ] Failed to enqueue job %s to DLQ: %s", job_id, e, extra={"job_id": job_id})
 
     def cancel_job(self, job_id: str):
         if self.client.hexists(self.job_status_hash, job_id):
@@ -0,0 +1,56 @@
+# plugins/profiler.py
+
+import cProfile
+import logging
+import os
+import random
+import threading
+from typing import List, Optional
+
+from core.hooks import Hook
+
+
+class SampledProfilerHook(Hook):
+    """
+    Runs cProfile around a random sample of handler calls and dumps each capture to
+    {output_dir}/{queue_name}/{job_id}.prof, readable with pstats or snakeviz.
+    Only one capture runs at a time per process; samples that overlap a running capture are skipped.
+    """
+
+    def __init__(self, sample_rate: float, queues: Optional[List[str]] = None, output_dir: str = "profiles"):
+        self.sample_rate = sample_rate
+        self.queues = set(queues) if queues else None
+        self.output_dir = output_dir
+        self._local = threading.local()
+        self._capture_lock = threading.Lock()
+
+    def before_handler(self, queue_name: str, job_id: str, payload: dict):
+        self._local.profiler = None
+        if self.queues is not None and queue_name not in self.queues:
+            return
+        if random.random() >= self.sample_rate:
+            return
+        if not self._capture_lock.acquire(blocking=False):
+            return
+        profiler = cProfile.Profile()
+        self._local.profiler = profiler
+        try:
+            profiler.enable()
+        except Exception:
+            self._local.profiler = None
+            self._capture_lock.release()
+            raise
+
+    def after_handler(self, queue_name: str, job_id: str, payload: dict, error: Optional[Exception]):
+        profiler = getattr(self._local, "profiler", None)
+        if profiler is None:
+            return
+        profiler.disable()
+        self._local.profiler = None
+        self._capture_lock.release()
+
+        queue_dir = os.path.join(self.output_dir, queue_name)
+        os.makedirs(queue_dir, exist_ok=True)
+        path = os.path.join(queue_dir, f"{job_id}.prof")
+        profiler.dump_stats(path)
+        logging.info("[profiler] Saved profile for job %s to %s", job_id, path, extra={"job_id": job_id})
@@ -0,0 +1,30 @@
+# plugins/slow_job.py
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from core.hooks import Hook
+
+
+class SlowJobLogHook(Hook):
+    """
+    Logs a warning for every handler call that runs longer than threshold_seconds.
+    """
+
+    def __init__(self, threshold_seconds: float):
+        self.threshold_seconds = threshold_seconds
+        self._local = threading.local()
+
+    def before_handler(self, queue_name: str, job_id: str, payload: dict):
+        self._local.started = time.perf_counter()
+
+    def after_handler(self, queue_name: str, job_id: str, payload: dict, error: Optional[Exception]):
+        elapsed = time.perf_counter() - self._local.started
+        if elapsed > self.threshold_seconds:
+            logging.warning(
+                "[slow_job] Job %s on queue %s took %.3fs (threshold %.3fs)",
+                job_id, queue_name, elapsed, self.threshold_seconds,
+                extra={"job_id": job_id}
+            )
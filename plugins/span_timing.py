@@ -0,0 +1,84 @@
+# plugins/span_timing.py
+
+import atexit
+import json
+import threading
+import time
+from typing import Optional
+
+from core.hooks import Hook
+
+
+class SpanTimingHook(Hook):
+    """
+    Records how long each lifecycle stage of a job takes and appends one JSON line per job to path:
+
+    - status_check_ms: payload decode and cancellation check (after_claim -> before_dedup)
+    - dedup_ms: acquiring the dedup lock (before_dedup -> after_dedup)
+    - pre_handler_ms: marking the job in progress (after_dedup -> before_handler)
+    - handler_ms: the registered handler (before_handler -> after_handler)
+    - post_handler_ms: status updates, retries/DLQ, workflow and offset commit (after_handler -> after_ack)
+    - total_ms: after_claim -> after_ack
+
+    Idle time spent blocking on empty streams happens before after_claim and is never counted.
+    Stages a job did not reach (cancelled, duplicate) are omitted.
+    """
+
+    SPANS = (
+        ("status_check_ms", "after_claim", "before_dedup"),
+        ("dedup_ms", "before_dedup", "after_dedup"),
+        ("pre_handler_ms", "after_dedup", "before_handler"),
+        ("handler_ms", "before_handler", "after_handler"),
+        ("post_handler_ms", "after_handler", "after_ack"),
+        ("total_ms", "after_claim", "after_ack"),
+    )
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        atexit.register(self.close)
+
+    def after_claim(self, queue_name: str, job_id: str):
+        self._local.marks = {"after_claim": time.perf_counter()}
+
+    def before_dedup(self, queue_name: str, job_id: str):
+        self._mark("before_dedup")
+
+    def after_dedup(self, queue_name: str, job_id: str):
+        self._mark("after_dedup")
+
+    def before_handler(self, queue_name: str, job_id: str, payload: dict):
+        self._mark("before_handler")
+
+    def after_handler(self, queue_name: str, job_id: str, payload: dict, error: Optional[Exception]):
+        self._mark("after_handler")
+
+    def after_ack(self, queue_name: str, job_id: str, result: str):
+        marks = getattr(self._local, "marks", None)
+        if marks is None:
+            return
+        self._local.marks = None
+        marks["after_ack"] = time.perf_counter()
+
+        record = {"job_id": job_id, "queue": queue_name, "result": result}
+        for name, start, end in self.SPANS:
+            if start in marks and end in marks:
+                record[name] = round((marks[end] - marks[start]) * 1000, 3)
+
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    def _mark(self, event: str):
+        # Stages only count for jobs claimed by the worker loop on this thread;
+        # JobProcessor.execute called directly never fires after_claim.
+        marks = getattr(self._local, "marks", None)
+        if marks is not None:
+            marks[event] = time.perf_counter()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
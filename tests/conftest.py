@@ -0,0 +1,26 @@
+# tests/conftest.py
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import handler_registry, hooks
+from infrastructure.memory_job_store import InMemoryJobStore
+
+
+@pytest.fixture
+def job_store():
+    # Non-blocking reads keep worker loops in tests fast
+    return InMemoryJobStore(block_seconds=0)
+
+
+@pytest.fixture(autouse=True)
+def isolated_registries():
+    handlers = dict(handler_registry._handler_map)
+    yield
+    handler_registry._handler_map.clear()
+    handler_registry._handler_map.update(handlers)
+    hooks.clear_hooks()
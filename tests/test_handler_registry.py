@@ -0,0 +1,38 @@
+# tests/test_handler_registry.py
+
+import pytest
+
+from core import queue_config
+from core.handler_registry import import_handler
+from core.queue_config import QueueConfig
+from handlers.default import handle_default_job
+
+
+def test_import_handler_accepts_colon_and_dotted_forms():
+    assert import_handler("handlers.default:handle_default_job") is handle_default_job
+    assert import_handler("handlers.default.handle_default_job") is handle_default_job
+
+
+@pytest.mark.parametrize("import_path", ["handle_default_job", ":handle_default_job", "handlers.default:"])
+def test_import_handler_rejects_malformed_strings(import_path):
+    with pytest.raises(ValueError):
+        import_handler(import_path)
+
+
+def test_queue_config_resolves_handler_once(monkeypatch):
+    calls = []
+
+    def counting_import(import_path):
+        calls.append(import_path)
+        return import_handler(import_path)
+
+    monkeypatch.setattr(queue_config, "import_handler", counting_import)
+    config = QueueConfig(name="default", handler="handlers.default:handle_default_job")
+
+    assert config.get_handler() is handle_default_job
+    assert config.get_handler() is handle_default_job
+    assert calls == ["handlers.default:handle_default_job"]
+
+
+def test_queue_config_without_handler_resolves_to_none():
+    assert QueueConfig(name="email").get_handler() is None
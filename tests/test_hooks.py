@@ -0,0 +1,138 @@
+# tests/test_hooks.py
+
+import json
+import logging
+import os
+import threading
+
+from config.settings import settings
+from core import hooks
+from core.hooks import Hook, call_hooks, get_hooks, register_builtin_hooks, register_hook
+from core.handler_registry import register_handler
+from core.processor import JobProcessor
+from core.registry import get_registered_queues
+from plugins.profiler import SampledProfilerHook
+from plugins.slow_job import SlowJobLogHook
+from plugins.span_timing import SpanTimingHook
+from retry.strategies import FixedRetryStrategy
+
+
+def test_register_hook_only_registers_overridden_events():
+    class AckHook(Hook):
+        def after_ack(self, queue_name, job_id, result):
+            pass
+
+    hook = AckHook()
+    register_hook(hook)
+
+    assert get_hooks("after_ack") == [hook.after_ack]
+    assert all(not get_hooks(event) for event in hooks.HOOK_EVENTS if event != "after_ack")
+
+
+def test_call_hooks_logs_failures_and_keeps_going(caplog):
+    calls = []
+
+    def broken(queue_name, job_id):
+        raise RuntimeError("boom")
+
+    with caplog.at_level(logging.WARNING):
+        call_hooks([broken, lambda *args: calls.append(args)], "default", "job-1")
+
+    assert calls == [("default", "job-1")]
+    assert "boom" in caplog.text
+    assert caplog.records[0].job_id == "job-1"
+
+
+def test_register_builtin_hooks_is_idempotent(monkeypatch):
+    monkeypatch.setattr(settings, "slow_job_threshold", 1.0)
+
+    register_builtin_hooks()
+    register_builtin_hooks()
+    assert len(get_hooks("after_handler")) == 1
+
+    # clear_hooks resets the flag so the plugins can be registered again
+    hooks.clear_hooks()
+    register_builtin_hooks()
+    assert len(get_hooks("after_handler")) == 1
+
+
+def test_span_timing_writes_one_line_per_job(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    hook = SpanTimingHook(str(path))
+
+    hook.after_claim("default", "job-1")
+    hook.before_dedup("default", "job-1")
+    hook.after_dedup("default", "job-1")
+    hook.before_handler("default", "job-1", {})
+    hook.after_handler("default", "job-1", {}, None)
+    hook.after_ack("default", "job-1", "completed")
+    # A duplicate never reaches the dedup lock or the handler
+    hook.after_claim("default", "job-1")
+    hook.before_dedup("default", "job-1")
+    hook.after_ack("default", "job-1", "duplicate")
+    hook.close()
+
+    completed, duplicate = [json.loads(line) for line in path.read_text().splitlines()]
+    assert {k: completed[k] for k in ("job_id", "queue", "result")} == {"job_id": "job-1", "queue": "default", "result": "completed"}
+    assert set(completed) - {"job_id", "queue", "result"} == {name for name, _, _ in SpanTimingHook.SPANS}
+    assert set(duplicate) == {"job_id", "queue", "result", "status_check_ms", "total_ms"}
+
+
+def test_span_timing_ignores_jobs_not_claimed_by_the_worker(tmp_path, job_store, caplog):
+    path = tmp_path / "spans.jsonl"
+    hook = SpanTimingHook(str(path))
+    register_hook(hook)
+    register_handler("default", lambda payload: None)
+    queue = {q.name: q for q in get_registered_queues(job_store)}["default"]
+    processor = JobProcessor(job_store, FixedRetryStrategy(max_retries=1, delay=0))
+
+    with caplog.at_level(logging.WARNING):
+        assert processor.execute(queue, "job-1", {}, "disqueue:default:high") == "completed"
+    hook.close()
+
+    assert "[hooks]" not in caplog.text
+    assert path.read_text() == ""
+
+
+def test_slow_job_hook_warns_only_above_threshold(caplog):
+    with caplog.at_level(logging.WARNING):
+        fast = SlowJobLogHook(threshold_seconds=60)
+        fast.before_handler("default", "fast-job", {})
+        fast.after_handler("default", "fast-job", {}, None)
+
+        slow = SlowJobLogHook(threshold_seconds=0)
+        slow.before_handler("default", "slow-job", {})
+        slow.after_handler("default", "slow-job", {}, None)
+
+    assert [r.job_id for r in caplog.records] == ["slow-job"]
+    assert "slow-job on queue default" in caplog.text
+
+
+def test_profiler_captures_one_job_at_a_time(tmp_path):
+    hook = SampledProfilerHook(sample_rate=1.0, queues=["default"], output_dir=str(tmp_path))
+    overlapping = []
+
+    hook.before_handler("default", "job-1", {})
+
+    def overlapping_job():
+        hook.before_handler("default", "job-2", {})
+        overlapping.append(hook._local.profiler)
+        hook.after_handler("default", "job-2", {}, None)
+
+    thread = threading.Thread(target=overlapping_job)
+    thread.start()
+    thread.join()
+    hook.after_handler("default", "job-1", {}, None)
+
+    assert overlapping == [None]
+    assert os.listdir(tmp_path / "default") == ["job-1.prof"]
+    assert not hook._capture_lock.locked()
+
+
+def test_profiler_skips_other_queues(tmp_path):
+    hook = SampledProfilerHook(sample_rate=1.0, queues=["default"], output_dir=str(tmp_path))
+
+    hook.before_handler("billing", "job-1", {})
+    hook.after_handler("billing", "job-1", {}, None)
+
+    assert os.listdir(tmp_path) == []
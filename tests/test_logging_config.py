@@ -0,0 +1,81 @@
+# tests/test_logging_config.py
+
+import json
+import logging
+import queue
+import sys
+
+from config.logging_config import JobSampleFilter, JsonFormatter, LazyQueueHandler
+
+
+def make_record(msg="hello %s", args=("world",), level=logging.INFO, exc_info=None, **extra):
+    record = logging.LogRecord("disqueue", level, __file__, 1, msg, args, exc_info)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_includes_context_fields():
+    entry = json.loads(JsonFormatter().format(make_record(job_id="job-1", queue="default", stream="disqueue:default:high")))
+
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "disqueue"
+    assert {k: entry[k] for k in ("job_id", "queue", "stream")} == {
+        "job_id": "job-1", "queue": "default", "stream": "disqueue:default:high",
+    }
+    assert "exc_info" not in entry
+
+
+def test_json_formatter_includes_exception():
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        record = make_record(level=logging.ERROR, exc_info=sys.exc_info())
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert "RuntimeError: boom" in entry["exc_info"]
+    assert "job_id" not in entry
+
+
+def test_job_sample_filter_is_stable_per_job():
+    sampler = JobSampleFilter(0.5)
+    job_ids = [f"job-{i}" for i in range(1000)]
+
+    first = [sampler.filter(make_record(job_id=job_id)) for job_id in job_ids]
+    second = [sampler.filter(make_record(job_id=job_id)) for job_id in job_ids]
+
+    assert first == second
+    assert 400 < sum(first) < 600
+
+
+def test_job_sample_filter_keeps_warnings_and_records_without_job():
+    sampler = JobSampleFilter(0.0)
+
+    assert not sampler.filter(make_record(job_id="job-1"))
+    assert sampler.filter(make_record(job_id="job-1", level=logging.WARNING))
+    assert sampler.filter(make_record(job_id="job-1", level=logging.ERROR))
+    assert sampler.filter(make_record())
+
+
+def test_lazy_queue_handler_defers_formatting_of_immutable_args():
+    handler = LazyQueueHandler(queue.SimpleQueue())
+    record = make_record("job %s attempt %s", ("job-1", 2))
+
+    handler.emit(record)
+    queued = handler.queue.get_nowait()
+
+    assert queued is record
+    assert queued.args == ("job-1", 2)
+
+
+def test_lazy_queue_handler_snapshots_mutable_args():
+    handler = LazyQueueHandler(queue.SimpleQueue())
+    payload = {"step": 1}
+
+    handler.emit(make_record("payload %s", (payload,)))
+    payload["step"] = 2
+    queued = handler.queue.get_nowait()
+
+    assert queued.getMessage() == "payload {'step': 1}"
+    assert queued.args is None
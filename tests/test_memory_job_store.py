@@ -0,0 +1,106 @@
+# tests/test_memory_job_store.py
+
+import json
+import threading
+import time
+
+from core.status import STATUS_CANCELLED, STATUS_QUEUED, STATUS_WAITING
+from infrastructure import factory
+from infrastructure.memory_job_store import InMemoryJobStore
+
+
+def test_read_resumes_after_last_id_and_trims_committed_entries(job_store):
+    job_store.enqueue_job("s", "a", {"n": 1}, "high")
+    job_store.enqueue_job("s", "b", {"n": 2}, "high")
+
+    msg_id, data = job_store.read_from_stream("s", "0")
+    assert data["job_id"] == "a"
+    assert json.loads(data["payload"]) == {"n": 1}
+    assert job_store.get_job_status("a") == STATUS_QUEUED
+
+    job_store.set_last_id("s", msg_id)
+    assert job_store.get_last_id("s") == msg_id
+    assert len(job_store._streams["s"]) == 1
+
+    _, data = job_store.read_from_stream("s", msg_id)
+    assert data["job_id"] == "b"
+
+
+def test_read_blocks_until_a_job_is_enqueued():
+    store = InMemoryJobStore(block_seconds=2)
+    threading.Timer(0.05, store.enqueue_job, args=("s", "late", {})).start()
+
+    started = time.monotonic()
+    result = store.read_from_stream("s", "0")
+
+    assert result[1]["job_id"] == "late"
+    assert time.monotonic() - started < 1
+
+
+def test_dedup_lock_is_exclusive_until_released(job_store):
+    assert job_store.acquire_dedup_lock("a", 60)
+    assert not job_store.acquire_dedup_lock("a", 60)
+    job_store.release_dedup_lock("a")
+    assert job_store.acquire_dedup_lock("a", 60)
+
+
+def test_expired_dedup_entries_are_evicted(job_store):
+    for i in range(100):
+        job_store.acquire_dedup_lock(f"job-{i}", 60)
+        job_store.mark_dedup_done(f"job-{i}", 0.01)
+    time.sleep(0.02)
+
+    assert job_store.acquire_dedup_lock("job-0", 60)
+    assert list(job_store._dedup) == ["job-0"]
+
+
+def test_enqueue_unless_cancelled(job_store):
+    job_store.mark_job_status("waiting", STATUS_WAITING)
+    job_store.mark_job_status("cancelled", STATUS_CANCELLED)
+
+    assert job_store.enqueue_job_unless_cancelled("s", "waiting", {})
+    assert not job_store.enqueue_job_unless_cancelled("s", "cancelled", {})
+
+    assert job_store.get_job_status("waiting") == STATUS_QUEUED
+    assert job_store.get_job_status("cancelled") == STATUS_CANCELLED
+    assert job_store.read_from_stream("s", "1-0") is None
+
+
+def test_chord_callback_is_returned_exactly_once_across_threads(job_store):
+    members = 50
+    job_store.create_chord("c", members, {"job_id": "callback"})
+    results = []
+    barrier = threading.Barrier(members)
+
+    def complete():
+        barrier.wait()
+        results.append(job_store.complete_chord_member("c"))
+
+    threads = [threading.Thread(target=complete) for _ in range(members)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [r for r in results if r] == [{"job_id": "callback"}]
+    assert job_store.complete_chord_member("c") is None
+
+
+def test_get_job_store_builds_one_store_across_threads(monkeypatch):
+    monkeypatch.setattr(factory.settings, "job_store_backend", "memory")
+    monkeypatch.setattr(factory, "_job_store", None)
+    barrier = threading.Barrier(8)
+    stores = []
+
+    def resolve():
+        barrier.wait()
+        stores.append(factory.get_job_store())
+
+    threads = [threading.Thread(target=resolve) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len({id(store) for store in stores}) == 1
+    assert isinstance(stores[0], InMemoryJobStore)
@@ -0,0 +1,47 @@
+# tests/test_processor.py
+
+import json
+
+import pytest
+
+from core.handler_registry import register_handler
+from core.processor import JobProcessor
+from core.registry import get_registered_queues
+from core.status import STATUS_COMPLETED, STATUS_FAILED, STATUS_RETRYING
+from retry.strategies import FixedRetryStrategy
+
+STREAM = "disqueue:billing:high"
+
+
+@pytest.fixture
+def billing(job_store):
+    return {q.name: q for q in get_registered_queues(job_store)}["billing"]
+
+
+def test_successful_job_is_completed(job_store, billing):
+    calls = []
+    register_handler("billing", calls.append)
+    processor = JobProcessor(job_store, FixedRetryStrategy(max_retries=2, delay=0))
+
+    assert processor.execute(billing, "job", {"n": 1}, STREAM) == "completed"
+    assert calls == [{"n": 1}]
+    assert job_store.get_job_status("job") == STATUS_COMPLETED
+    # The dedup marker stays, so a redelivered message is skipped
+    assert processor.execute(billing, "job", {"n": 1}, STREAM) == "duplicate"
+    assert len(calls) == 1
+
+
+def test_failed_job_is_retried_then_sent_to_dlq(job_store, billing):
+    processor = JobProcessor(job_store, FixedRetryStrategy(max_retries=2, delay=0))
+    payload = {"fail": True}
+
+    assert processor.execute(billing, "job", payload, STREAM) == "retrying"
+    assert job_store.get_job_status("job") == STATUS_RETRYING
+    _, requeued = job_store.read_from_stream(STREAM, "0")
+    assert json.loads(requeued["payload"]) == payload
+
+    assert processor.execute(billing, "job", payload, STREAM) == "failed"
+    assert job_store.get_job_status("job") == STATUS_FAILED
+    assert job_store.get_retry_count("job") == 0
+    assert [entry["job_id"] for entry in job_store.dlq] == ["job"]
+    assert job_store.dlq[0]["reason"] == "Simulated failure"
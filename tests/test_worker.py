@@ -0,0 +1,82 @@
+# tests/test_worker.py
+
+import sys
+import threading
+
+import pytest
+
+from config.queue_registry import REGISTERED_QUEUES
+from core import worker
+from core.handler_registry import register_handler
+from core.hooks import Hook, register_hook
+from core.registry import get_registered_queues
+from core.status import STATUS_COMPLETED
+from core.workflow import JobSignature, WorkflowManager
+
+
+def run_worker_until(job_store, queue_names, done, seconds=5):
+    """Run start_worker until done() is true after an ack, or fail after `seconds`."""
+    timed_out = threading.Event()
+
+    class StopWhenDone(Hook):
+        def after_ack(self, queue_name, job_id, result):
+            if done():
+                worker.shutdown_event.set()
+
+    def stop_on_timeout():
+        timed_out.set()
+        worker.shutdown_event.set()
+
+    register_hook(StopWhenDone())
+    # Safety net: a job that never finishes must fail the test, not hang the suite
+    timeout = threading.Timer(seconds, stop_on_timeout)
+    timeout.start()
+    try:
+        worker.start_worker(job_store, queue_names)
+    finally:
+        timeout.cancel()
+        worker.shutdown_event.clear()
+    assert not timed_out.is_set(), f"worker did not finish within {seconds}s"
+
+
+def test_start_worker_rejects_unknown_queue_filter(job_store):
+    with pytest.raises(worker.NoQueuesError):
+        worker.start_worker(job_store, ["typo"])
+
+
+def test_main_exits_when_no_queue_matches(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["worker", "--queues", "typo"])
+    monkeypatch.setattr(worker, "configure_logging", lambda: None)
+    monkeypatch.setattr(worker.signal, "signal", lambda *args: None)
+
+    with pytest.raises(SystemExit) as exc_info:
+        worker.main()
+
+    assert exc_info.value.code == 1
+
+
+def test_filtered_worker_imports_only_its_queue_handlers(job_store, monkeypatch):
+    for name in ("handlers.default", "handlers.image_processing"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    for config in REGISTERED_QUEUES:
+        monkeypatch.setattr(config, "_resolved_handler", None)
+
+    queue = {q.name: q for q in get_registered_queues(job_store)}["image_processing"]
+    queue.enqueue("job-1", {"duration": 0}, "high")
+
+    run_worker_until(job_store, ["image_processing"], lambda: job_store.get_job_status("job-1") == STATUS_COMPLETED)
+
+    assert "handlers.image_processing" in sys.modules
+    assert "handlers.default" not in sys.modules
+
+
+def test_worker_runs_chain_end_to_end(job_store):
+    processed = []
+    register_handler("default", lambda payload: processed.append(payload["n"]))
+    manager = WorkflowManager(get_registered_queues(job_store), job_store)
+    ids = manager.enqueue_chain([JobSignature("default", {"n": i}, "high") for i in range(3)])
+
+    run_worker_until(job_store, ["default"], lambda: len(processed) == 3)
+
+    assert processed == [0, 1, 2]
+    assert [job_store.get_job_status(i) for i in ids] == [STATUS_COMPLETED] * 3
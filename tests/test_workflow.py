@@ -0,0 +1,188 @@
+# tests/test_workflow.py
+
+import pytest
+from fastapi import HTTPException
+
+from api.models import ChainRequest, JobRequest
+from api.routes.workflow_routes import submit_chain
+from core.registry import get_registered_queues
+from core.status import STATUS_CANCELLED, STATUS_FAILED, STATUS_QUEUED, STATUS_WAITING
+from core.workflow import JobSignature, WorkflowEnqueueError, WorkflowManager
+from infrastructure.memory_job_store import InMemoryJobStore
+
+
+class FailingJobStore(InMemoryJobStore):
+    """Fails enqueues of the given job ids the way RedisJobStore does on a storage error."""
+
+    def __init__(self, failing_ids=()):
+        super().__init__(block_seconds=0)
+        self.failing_ids = set(failing_ids)
+
+    def enqueue_job(self, stream_name, job_id, payload, priority="high"):
+        if job_id in self.failing_ids:
+            return False
+        return super().enqueue_job(stream_name, job_id, payload, priority)
+
+    def enqueue_job_unless_cancelled(self, stream_name, job_id, payload, priority="high"):
+        if job_id in self.failing_ids:
+            raise ConnectionError("storage unavailable")
+        return super().enqueue_job_unless_cancelled(stream_name, job_id, payload, priority)
+
+
+@pytest.fixture
+def manager(job_store):
+    return WorkflowManager(get_registered_queues(job_store), job_store)
+
+
+def enqueued_ids(job_store, stream="disqueue:default:high"):
+    return [data["job_id"] for _, data in job_store._streams.get(stream, ())]
+
+
+def steps(count, queue_name="default"):
+    return [JobSignature(queue_name, {"n": i}, "high") for i in range(count)]
+
+
+def test_chain_enqueues_next_step_when_previous_completes(manager, job_store):
+    ids = manager.enqueue_chain(steps(3))
+    assert enqueued_ids(job_store) == ids[:1]
+    assert [job_store.get_job_status(i) for i in ids] == [STATUS_QUEUED, STATUS_WAITING, STATUS_WAITING]
+
+    manager.on_job_completed(ids[0])
+    assert enqueued_ids(job_store) == ids[:2]
+
+    manager.on_job_completed(ids[1])
+    assert enqueued_ids(job_store) == ids
+
+
+def test_chain_failure_fails_remaining_steps(manager, job_store):
+    ids = manager.enqueue_chain(steps(3))
+
+    manager.on_job_failed(ids[0])
+
+    assert [job_store.get_job_status(i) for i in ids[1:]] == [STATUS_FAILED, STATUS_FAILED]
+    assert enqueued_ids(job_store) == ids[:1]
+
+
+def test_chain_stops_at_cancelled_step(manager, job_store):
+    ids = manager.enqueue_chain(steps(3))
+    job_store.cancel_job(ids[1])
+
+    manager.on_job_completed(ids[0])
+
+    assert enqueued_ids(job_store) == ids[:1]
+    assert job_store.get_job_status(ids[1]) == STATUS_CANCELLED
+    assert job_store.get_job_status(ids[2]) == STATUS_CANCELLED
+
+
+def test_chord_callback_is_enqueued_once_after_all_members(manager, job_store):
+    members = steps(3, "image_processing")
+    callback = JobSignature("default", {}, "high")
+    manager.enqueue_chord(members, callback)
+
+    for member in members[:-1]:
+        manager.on_job_completed(member.job_id)
+        assert enqueued_ids(job_store) == []
+    manager.on_job_completed(members[-1].job_id)
+    # A repeated completion must not fire the callback again
+    manager.on_job_completed(members[-1].job_id)
+
+    assert enqueued_ids(job_store) == [callback.job_id]
+
+
+def test_chord_member_failure_fails_callback(manager, job_store):
+    members = steps(2, "image_processing")
+    callback = JobSignature("default", {}, "high")
+    manager.enqueue_chord(members, callback)
+
+    manager.on_job_failed(members[0].job_id)
+    manager.on_job_completed(members[1].job_id)
+
+    assert job_store.get_job_status(callback.job_id) == STATUS_FAILED
+    assert enqueued_ids(job_store) == []
+
+
+def test_empty_chord_is_rejected(manager):
+    with pytest.raises(ValueError):
+        manager.enqueue_chord([], JobSignature("default", {}, "high"))
+
+
+def test_invalid_step_starts_nothing(manager, job_store):
+    with pytest.raises(ValueError):
+        manager.enqueue_chain(steps(1) + [JobSignature("unknown", {}, "high")])
+    assert enqueued_ids(job_store) == []
+
+
+def failing_manager(failing_ids):
+    job_store = FailingJobStore(failing_ids)
+    return WorkflowManager(get_registered_queues(job_store), job_store), job_store
+
+
+def test_chain_enqueue_failure_fails_every_step():
+    chain = steps(3)
+    manager, job_store = failing_manager([chain[0].job_id])
+
+    with pytest.raises(WorkflowEnqueueError):
+        manager.enqueue_chain(chain)
+
+    assert [job_store.get_job_status(s.job_id) for s in chain] == [STATUS_FAILED] * 3
+    assert job_store.pop_job_workflow(chain[0].job_id) is None
+
+
+def test_group_enqueue_failure_fails_remaining_jobs():
+    group = steps(3)
+    manager, job_store = failing_manager([group[1].job_id])
+
+    with pytest.raises(WorkflowEnqueueError):
+        manager.enqueue_group(group)
+
+    assert [job_store.get_job_status(s.job_id) for s in group] == [STATUS_QUEUED, STATUS_FAILED, STATUS_FAILED]
+
+
+def test_chord_enqueue_failure_discards_chord_and_fails_callback():
+    members = steps(3, "image_processing")
+    callback = JobSignature("default", {}, "high")
+    manager, job_store = failing_manager([members[1].job_id])
+
+    with pytest.raises(WorkflowEnqueueError):
+        manager.enqueue_chord(members, callback)
+
+    assert job_store._chords == {}
+    assert job_store.get_job_status(callback.job_id) == STATUS_FAILED
+    assert [job_store.get_job_status(m.job_id) for m in members] == [STATUS_QUEUED, STATUS_FAILED, STATUS_FAILED]
+    # The member that did get enqueued completes without reviving the chord
+    manager.on_job_completed(members[0].job_id)
+    assert enqueued_ids(job_store) == []
+
+
+def test_chain_advance_failure_fails_remaining_steps():
+    chain = steps(3)
+    manager, job_store = failing_manager([chain[1].job_id])
+    manager.enqueue_chain(chain)
+
+    with pytest.raises(ConnectionError):
+        manager.on_job_completed(chain[0].job_id)
+
+    assert [job_store.get_job_status(s.job_id) for s in chain[1:]] == [STATUS_FAILED, STATUS_FAILED]
+
+
+def test_chord_callback_enqueue_failure_fails_callback():
+    members = steps(1, "image_processing")
+    callback = JobSignature("default", {}, "high")
+    manager, job_store = failing_manager([callback.job_id])
+    manager.enqueue_chord(members, callback)
+
+    with pytest.raises(ConnectionError):
+        manager.on_job_completed(members[0].job_id)
+
+    assert job_store.get_job_status(callback.job_id) == STATUS_FAILED
+
+
+def test_chain_route_maps_enqueue_failure_to_500():
+    manager, _ = failing_manager([])
+    manager.job_store.enqueue_job = lambda *args, **kwargs: False
+    request = ChainRequest(steps=[JobRequest(queue_name="default", payload={}, priority="high")])
+
+    with pytest.raises(HTTPException) as exc_info:
+        submit_chain(request, workflow_manager=manager)
+
+    assert exc_info.value.status_code == 500
@@ -2,13 +2,13 @@
 
 import logging
 from functools import wraps
-from infrastructure.redis_conn import redis_client
 
-def deduplicated(ttl_seconds: int = 3600, on_first_attempt=None):
+def deduplicated(job_store, ttl_seconds: int = 3600, on_first_attempt=None):
     """
     A decorator function to ensure idempotent job execution.
     
     Args:
+        job_store: JobStore holding the dedup locks.
         ttl_seconds: How long to keep dedup key (in seconds).
         on_first_attempt: Optional function to call before processing if job is not duplicate.
     """
@@ -30,26 +30,25 @@ def deduplicated(ttl_seconds: int = 3600, on_first_attempt=None):
                 logging.error("Missing job_id in payload.")
                 raise ValueError("Missing job_id in payload.")
 
-            dedup_key = get_dedup_key(job_id)
-            is_first_attempt = redis_client.set(dedup_key, "processing", nx=True, ex=ttl_seconds)
+            is_first_attempt = job_store.acquire_dedup_lock(job_id, ttl_seconds)
             # logging.info(f"Set dedup key result for {job_id}: {is_first_attempt}")
 
             if not is_first_attempt:
-                logging.info(f"[Deduplication] Duplicate job {job_id}. Skipping.")
+                logging.info("[Deduplication] Duplicate job %s. Skipping.", job_id, extra={"job_id": job_id})
                 return "duplicate"
 
             if on_first_attempt:
                 try:
                     on_first_attempt(job_id)
                 except Exception as hook_error:
-                    logging.warning(f"[Deduplication] on_first_attempt failed for {job_id}: {hook_error}")
+                    logging.warning("[Deduplication] on_first_attempt failed for %s: %s", job_id, hook_error, extra={"job_id": job_id})
 
             try:
                 result = func(*args, **kwargs)
-                redis_client.set(dedup_key, "done", ex=86400)  # Keep for 1 day
+                job_store.mark_dedup_done(job_id, 86400)  # Keep for 1 day
                 return result
             except Exception:
-                logging.exception(f"[Deduplication] Error processing job {job_id}")
+                logging.exception("[Deduplication] Error processing job %s", job_id, extra={"job_id": job_id})
                 raise
         return wrapper
     return decorator